@@ -0,0 +1,287 @@
+import argparse
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR))
+
+import gcp_bigquery  # noqa: E402
+
+
+def test_regexes_are_compiled_at_module_level():
+    # Inline re.search("...")-style calls recompile or re-look-up the pattern on every call
+    source = (TOOLS_DIR / "gcp_bigquery.py").read_text()
+    inline_calls = re.findall(r"re\.(?:search|match|fullmatch|sub|findall|split)\(\s*r?['\"]", source)
+    assert inline_calls == []
+
+
+@pytest.mark.parametrize("query", [
+    "INSERT INTO d.t VALUES (1)",
+    "UPDATE d.t SET a = 1 WHERE true",
+    "DELETE FROM d.t WHERE true",
+    "CREATE TABLE d.t (a INT64)",
+    "DROP TABLE d.t",
+    "ALTER TABLE d.t ADD COLUMN b STRING",
+    "MERGE d.t USING d.s ON false WHEN NOT MATCHED THEN INSERT ROW",
+    "TRUNCATE TABLE d.t",
+    "GRANT `roles/bigquery.dataViewer` ON TABLE d.t TO 'user:a@example.com'",
+    "REVOKE `roles/bigquery.dataViewer` ON TABLE d.t FROM 'user:a@example.com'",
+    "insert into d.t values (1)",
+    "SELECT 1; DELETE FROM d.t WHERE true",
+    "CREATE OR REPLACE TABLE d.t AS SELECT 1",
+    "create or replace view d.v as select 1",
+    "CREATE OR REPLACE TEMP TABLE t AS SELECT 1",
+    "CREATE\tOR\nREPLACE FUNCTION d.f() AS (1)",
+    "EXECUTE IMMEDIATE 'DROP TABLE d.t'",
+    'EXECUTE IMMEDIATE "DELETE FROM d.t WHERE true"',
+    "execute immediate 'SELECT 1'",
+    # sqlparse lexes these GoogleSQL strings and comments differently from BigQuery
+    "SELECT ''' ' ''' AS a; DROP TABLE d.t; SELECT ''' ' '''",
+    'SELECT """ " """ AS a; DROP TABLE d.t; SELECT """ " """',
+    "SELECT '''it's''' AS x; DROP TABLE d.t; SELECT 'b'",
+    r"SELECT 'a\\' AS x; DROP TABLE d.t; SELECT 'b'",
+    "SELECT 1 #'\nDROP TABLE d.t; SELECT '",
+])
+def test_is_readonly_rejects_modifying_statements(query):
+    assert gcp_bigquery._is_readonly(query) is False
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT 1",
+    "SELECT a FROM d.t ORDER BY a DESC LIMIT 10",
+    "WITH x AS (SELECT 1 AS a) SELECT a FROM x",
+    "SELECT 'delete' AS word FROM d.t",
+    "SELECT a FROM d.t -- drop this later",
+    "SELECT a /* update me */ FROM d.t",
+    "SELECT * FROM `p.d.delete_log`",
+    "SELECT * FROM d.grants",
+    r"SELECT REGEXP_EXTRACT(a, r'\d+') FROM d.t",
+])
+def test_is_readonly_accepts_queries(query):
+    assert gcp_bigquery._is_readonly(query) is True
+
+
+# Both exceed sqlparse's token or nesting limits and make it raise SQLParseError
+LONG_IN_LIST_QUERY = "SELECT * FROM d.t WHERE id IN (" + ", ".join(f"'id{i}'" for i in range(3500)) + ")"
+DEEPLY_NESTED_QUERY = "SELECT " + "(" * 200 + "1" + ")" * 200 + " FROM d.t"
+
+
+@pytest.mark.parametrize("query", [LONG_IN_LIST_QUERY, DEEPLY_NESTED_QUERY])
+def test_query_helpers_handle_queries_sqlparse_rejects(query):
+    assert gcp_bigquery._is_readonly(query) is True
+    assert gcp_bigquery._is_readonly(query + "; DROP TABLE d.t") is False
+    assert gcp_bigquery._limit_query(query, 5) == query
+    assert gcp_bigquery._is_cacheable_query(query) is False
+
+
+@pytest.mark.parametrize("project_id, dataset_id", [
+    ("p-1", "d`.INFORMATION_SCHEMA.TABLES AS t; DROP TABLE d.x; SELECT ''' AS s FROM `p.d"),
+    ("p-1", "d\n"),
+    ("p-1`; DROP TABLE d.x; --", "d"),
+])
+def test_list_tables_with_descriptions_rejects_invalid_ids(project_id, dataset_id):
+    class FakeClient:
+        def query(self, query, job_config=None):
+            raise AssertionError("query must not run")
+
+    tool = gcp_bigquery.BigQueryTool.__new__(gcp_bigquery.BigQueryTool)
+    tool.client = FakeClient()
+    tool.project_id = project_id
+
+    with pytest.raises(SystemExit):
+        tool.list_tables(dataset_id, with_description=True)
+
+
+@pytest.mark.parametrize("project_id", ["my-project-1", "example.com:my-project"])
+def test_project_id_re_accepts_project_ids(project_id):
+    assert gcp_bigquery.PROJECT_ID_RE.fullmatch(project_id)
+
+
+def test_fetch_rows_falls_back_to_rest_when_storage_api_is_denied():
+    class FakeResults:
+        total_rows = 2000
+        schema = []
+
+        def to_arrow_iterable(self, bqstorage_client=None):
+            raise gcp_bigquery.PermissionDenied("readsessions.create denied")
+            yield
+
+    class FakeRows:
+        schema = [gcp_bigquery.bigquery.SchemaField("a", "INTEGER")]
+        next_page_token = None
+
+        def __iter__(self):
+            return iter([(1,), (2,)])
+
+    class FakeJob:
+        destination = gcp_bigquery.bigquery.TableReference.from_string("p.d.t")
+
+        def result(self):
+            return FakeResults()
+
+    class FakeClient:
+        def list_rows(self, table, **kwargs):
+            return FakeRows()
+
+    tool = gcp_bigquery.BigQueryTool.__new__(gcp_bigquery.BigQueryTool)
+    tool.client = FakeClient()
+    tool._bqstorage_client = object()
+    tool._bqstorage_available = True
+
+    rows, next_page_token = tool._fetch_rows(FakeJob(), 5000)
+
+    assert rows == [{"a": 1}, {"a": 2}]
+    assert next_page_token is None
+    assert tool._bqstorage_available is False
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT * FROM d.t WHERE ts < CURRENT_TIMESTAMP()",
+    "SELECT CURRENT_DATE",
+    "select rand() as r from d.t",
+    "SELECT GENERATE_UUID() FROM d.t",
+    "SELECT * FROM `p.region-us.INFORMATION_SCHEMA.JOBS`",
+    "SELECT table_name FROM d.INFORMATION_SCHEMA.TABLES",
+])
+def test_is_cacheable_query_rejects_volatile_queries(query):
+    assert not gcp_bigquery._is_cacheable_query(query)
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT * FROM d.t",
+    "SELECT 'rand()' AS s FROM d.t",
+    "SELECT a FROM d.t -- CURRENT_TIMESTAMP()",
+])
+def test_is_cacheable_query_accepts_queries(query):
+    assert gcp_bigquery._is_cacheable_query(query)
+
+
+def _cache_tool(monkeypatch, tmp_path, cache_key):
+    monkeypatch.setattr(gcp_bigquery, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(gcp_bigquery, "LAST_TOKEN_PATH", tmp_path / "cache" / "last_token")
+    tool = gcp_bigquery.BigQueryTool.__new__(gcp_bigquery.BigQueryTool)
+    tool.project_id = "p"
+    tool.next_page_token = None
+    tool._result_cache_key = cache_key
+    return tool
+
+
+def test_run_query_skips_cache_when_key_derivation_fails(monkeypatch, tmp_path):
+    def forbidden(*args):
+        raise gcp_bigquery.Forbidden("tables.get denied")
+
+    class FakeClient:
+        def query(self, query, job_config=None):
+            return "job"
+
+    tool = _cache_tool(monkeypatch, tmp_path, forbidden)
+    tool.client = FakeClient()
+    monkeypatch.setattr(tool, "_fetch_rows", lambda job, max_rows, page_token=None: ([{"a": 1}], None), raising=False)
+
+    assert tool.run_query("SELECT a FROM d.t") == [{"a": 1}]
+    assert not (tmp_path / "cache").exists()
+
+
+def test_run_query_cache_hit_restores_page_state(monkeypatch, tmp_path):
+    tool = _cache_tool(monkeypatch, tmp_path, lambda *args: "key")
+    page_state = {"project": "p", "job_id": "J1", "location": "US", "query": "q", "page_token": "3"}
+    gcp_bigquery._save_cached_result(
+        tmp_path / "cache" / "key.pkl",
+        {"rows": [{"a": 1}], "next_page_token": "3", "page_state": page_state},
+    )
+    gcp_bigquery.LAST_TOKEN_PATH.unlink(missing_ok=True)
+
+    assert tool.run_query("q", page_size=1) == [{"a": 1}]
+    assert tool.next_page_token == "3"
+    assert gcp_bigquery._load_page_state() == page_state
+
+
+@pytest.mark.parametrize("content", [
+    b"",
+    b"\x80\x04\x95",
+    b"cno_such_module\nThing\n.",
+    b"not a pickle",
+])
+def test_load_cached_result_treats_bad_files_as_a_miss(tmp_path, content):
+    path = tmp_path / "bad.pkl"
+    path.write_bytes(content)
+
+    assert gcp_bigquery._load_cached_result(path, gcp_bigquery.RESULT_CACHE_TTL) is None
+
+
+def test_cache_files_are_private(monkeypatch, tmp_path):
+    monkeypatch.setattr(gcp_bigquery, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(gcp_bigquery, "LAST_TOKEN_PATH", tmp_path / "cache" / "last_token")
+
+    gcp_bigquery._save_page_state({"page_token": "3"})
+    gcp_bigquery._save_cached_result(tmp_path / "cache" / "key.pkl", {"rows": []})
+
+    assert (tmp_path / "cache").stat().st_mode & 0o777 == 0o700
+    assert gcp_bigquery.LAST_TOKEN_PATH.stat().st_mode & 0o777 == 0o600
+    assert (tmp_path / "cache" / "key.pkl").stat().st_mode & 0o777 == 0o600
+
+
+def test_save_cached_result_removes_expired_entries(monkeypatch, tmp_path):
+    monkeypatch.setattr(gcp_bigquery, "CACHE_DIR", tmp_path)
+    expired = tmp_path / "old.pkl"
+    expired.write_bytes(b"")
+    os.utime(expired, (0, 0))
+    # Past the default TTL but another run may still read it with a longer one
+    recent = tmp_path / "recent.pkl"
+    recent.write_bytes(b"")
+    an_hour_ago = time.time() - 3600
+    os.utime(recent, (an_hour_ago, an_hour_ago))
+
+    gcp_bigquery._save_cached_result(tmp_path / "new.pkl", {"rows": []})
+
+    assert not expired.exists()
+    assert recent.exists()
+    assert (tmp_path / "new.pkl").exists()
+
+
+@pytest.mark.parametrize("result, expected_stdout", [
+    ([{"a": 1}, {"a": 2}], "a\n1\n2\n"),
+    ([], ""),
+    ("Error executing query: boom", ""),
+])
+def test_run_query_csv_keeps_messages_out_of_stdout(monkeypatch, capsys, result, expected_stdout):
+    class FakeTool:
+        next_page_token = None
+
+        def __init__(self, project_id=None):
+            pass
+
+        def run_query(self, *args, **kwargs):
+            return result
+
+    monkeypatch.setattr(gcp_bigquery, "BigQueryTool", FakeTool)
+    monkeypatch.setattr(sys, "argv", ["gcp_bigquery.py", "run-query", "SELECT a FROM d.t", "--format", "csv"])
+
+    gcp_bigquery.main()
+
+    assert capsys.readouterr().out == expected_stdout
+
+
+def test_positive_int_accepts_positive_values():
+    assert gcp_bigquery._positive_int("25") == 25
+
+
+@pytest.mark.parametrize("value", ["0", "-5", "five"])
+def test_positive_int_rejects_other_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        gcp_bigquery._positive_int(value)
+
+
+def test_non_negative_int_accepts_zero():
+    assert gcp_bigquery._non_negative_int("0") == 0
+
+
+@pytest.mark.parametrize("value", ["-1", "ten"])
+def test_non_negative_int_rejects_other_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        gcp_bigquery._non_negative_int(value)
@@ -13,35 +13,430 @@ Features:
 
 Requirements:
 - google-cloud-bigquery
+- sqlparse
+- cachetools
 - tabulate
 - python-dotenv
+- google-cloud-bigquery-storage, pyarrow (optional, for large results)
 """
 
 import argparse
+import csv
+import functools
+import hashlib
+import importlib.util
+import io
+import json
 import os
-import sys
+import pickle
 import re
-from typing import List, Dict, Any, Optional, Union, Tuple
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import RLock
+from typing import List, Dict, Any, Optional, Union, Tuple, TextIO
 
 try:
     from google.cloud import bigquery
-    from google.cloud.exceptions import GoogleCloudError
-    from tabulate import tabulate
+    from google.cloud.bigquery.retry import DEFAULT_RETRY
+    from google.api_core.exceptions import PermissionDenied
+    from google.cloud.exceptions import GoogleCloudError, Forbidden
+    from requests.adapters import HTTPAdapter
+    import sqlparse
+    from sqlparse.exceptions import SQLParseError
+    from cachetools import TTLCache, cached
+    from cachetools.keys import hashkey
     from dotenv import load_dotenv
+    # format_output imports tabulate lazily; check now so a missing install gets this message
+    if importlib.util.find_spec("tabulate") is None:
+        raise ImportError("No module named 'tabulate'")
 except ImportError:
     print("Required dependencies not found. Please install them with:")
-    print("pip install google-cloud-bigquery tabulate python-dotenv")
+    print("pip install google-cloud-bigquery sqlparse cachetools tabulate python-dotenv")
     sys.exit(1)
 
+try:
+    # Optional: faster, columnar downloads of large results
+    from google.cloud import bigquery_storage
+except ImportError:
+    bigquery_storage = None
+
 # Load environment variables from .env file
 load_dotenv()
 
-# Regular expressions for SQL validation
-NON_READONLY_PATTERNS = [
-    re.compile(r'\b(INSERT|UPDATE|DELETE|CREATE|DROP|ALTER|MERGE|TRUNCATE)\b', re.IGNORECASE),
-    re.compile(r'\bGRANT\b.*\bTO\b', re.IGNORECASE),
-    re.compile(r'\bREVOKE\b.*\bFROM\b', re.IGNORECASE),
-]
+# Number of rows returned by run_query
+MAX_RESULT_ROWS = 5
+
+# Where the tool keeps state between CLI invocations
+CACHE_DIR = Path.home() / ".cache" / "gcp_bq"
+
+# Query job and page token from the last paged run-query, for resuming with --page-token
+LAST_TOKEN_PATH = CACHE_DIR / "last_token"
+
+# Seconds a cached run_query result stays valid
+RESULT_CACHE_TTL = 600
+
+# Age in seconds at which cache files are deleted, whatever --cache-ttl wrote or reads them
+RESULT_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Functions whose results change between runs; queries using them are never cached
+NONDETERMINISTIC_FUNCTIONS = frozenset({
+    "CURRENT_DATE", "CURRENT_DATETIME", "CURRENT_TIME", "CURRENT_TIMESTAMP",
+    "RAND", "GENERATE_UUID", "SESSION_USER",
+})
+
+# Results larger than this are downloaded as Arrow batches via the BigQuery Storage API
+ARROW_ROW_THRESHOLD = 1000
+
+# Limits for formatting pipe tables directly instead of through tabulate
+PIPE_TABLE_MAX_ROWS = 50
+PIPE_TABLE_MAX_CELL_WIDTH = 200
+
+# Upper bound on bytes billed per query; queries that would exceed it fail instead of running
+MAX_BYTES_BILLED = int(os.environ.get("BIGQUERY_MAX_BYTES_BILLED", 10 * 1024 ** 3))
+
+# Any LIMIT clause in the query, in which case run_query leaves it untouched
+LIMIT_RE = re.compile(r'\bLIMIT\b', re.IGNORECASE)
+
+# Valid dataset IDs and (optionally domain-scoped) project IDs; checked before
+# either is written into the text of an INFORMATION_SCHEMA query
+DATASET_ID_RE = re.compile(r'[A-Za-z0-9_]+')
+PROJECT_ID_RE = re.compile(r'(?:[a-z][a-z0-9.-]*[a-z0-9]:)?[a-z][a-z0-9-]*[a-z0-9]')
+
+# Keywords that indicate a non-read-only statement. EXECUTE (IMMEDIATE) is
+# included because the SQL it runs is a string literal the check can't inspect.
+NON_READONLY_KEYWORDS = frozenset({
+    "INSERT", "UPDATE", "DELETE", "CREATE", "DROP", "ALTER",
+    "MERGE", "TRUNCATE", "GRANT", "REVOKE", "EXECUTE",
+})
+
+# Fallback scan of the raw query text for the same keywords, used whenever
+# sqlparse's tokens can't be trusted to match BigQuery's
+NON_READONLY_RE = re.compile(
+    r'\b(?:' + "|".join(sorted(NON_READONLY_KEYWORDS)) + r')\b',
+    re.IGNORECASE
+)
+
+# GoogleSQL syntax sqlparse lexes differently from BigQuery: triple-quoted
+# strings, backslash escapes and "#" comments
+AMBIGUOUS_LEXING_RE = re.compile(r"'''|\"\"\"|\\|#")
+
+@functools.lru_cache(maxsize=1024)
+def _is_readonly(query: str) -> bool:
+    """
+    Check if a query is read-only, caching the result per query string.
+    
+    Args:
+        query: The SQL query to check.
+        
+    Returns:
+        True if the query is read-only, False otherwise.
+    """
+    # A string that sqlparse ends early or late could hide a whole statement,
+    # so fail closed and match keywords anywhere in the text
+    if AMBIGUOUS_LEXING_RE.search(query):
+        return NON_READONLY_RE.search(query) is None
+        
+    try:
+        statements = sqlparse.parse(query)
+    except SQLParseError:
+        # Very long or deeply nested queries exceed sqlparse's limits
+        return NON_READONLY_RE.search(query) is None
+        
+    # Comments, strings and quoted identifiers are separate tokens, so
+    # keywords inside them are never matched
+    for statement in statements:
+        for token in statement.flatten():
+            if token.ttype in sqlparse.tokens.Error:
+                return NON_READONLY_RE.search(query) is None
+            if not token.is_keyword:
+                continue
+            # Multi-word keywords like "CREATE OR REPLACE" arrive as a single token
+            if any(word in NON_READONLY_KEYWORDS for word in token.normalized.split()):
+                return False
+    return True
+
+# Concurrent metadata requests; the calls are network-bound, not CPU-bound
+MAX_METADATA_WORKERS = 16
+
+# HTTP connections kept alive per client; enough for the metadata thread pool
+HTTP_POOL_SIZE = 20
+
+@functools.lru_cache(maxsize=8)
+def _make_client(project_id: Optional[str]) -> bigquery.Client:
+    """
+    Create a BigQuery client, reusing an existing one for the same project.
+    
+    Building a client loads credentials and sets up a new HTTP session, so
+    repeated BigQueryTool instances in one process share a single client.
+    
+    Args:
+        project_id: GCP project ID, or None for the credentials' default project.
+        
+    Returns:
+        The BigQuery client.
+    """
+    client = bigquery.Client(project=project_id)
+    # Let concurrent metadata requests reuse keep-alive connections
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    client._http.mount("https://", adapter)
+    return client
+
+# Partial-response field masks, so metadata requests only return what each caller uses
+TABLE_DESCRIPTION_FIELDS = "tableReference,type,description"  # list_tables
+TABLE_SCHEMA_FIELDS = "tableReference,schema"  # get_schema
+TABLE_MODIFIED_FIELDS = "tableReference,type,lastModifiedTime,streamingBuffer"  # run_query result cache
+DATASET_DESCRIPTION_FIELDS = "datasetReference,description"  # list_datasets
+
+# Page size for list calls; the API default returns far fewer items per request
+LIST_PAGE_SIZE = 1000
+
+# Dataset/table metadata caches, keyed on the fully qualified ID and field mask
+_metadata_lock = RLock()
+_table_cache = TTLCache(maxsize=1024, ttl=300)
+_dataset_cache = TTLCache(maxsize=256, ttl=300)
+
+@cached(
+    _table_cache,
+    key=lambda client, table_id, fields: hashkey(table_id, fields),
+    lock=_metadata_lock
+)
+def _cached_get_table(client: bigquery.Client, table_id: str, fields: str) -> bigquery.Table:
+    """
+    Fetch table metadata, reusing results fetched within the last five minutes.
+    
+    Args:
+        client: The BigQuery client to use on a cache miss.
+        table_id: Fully qualified table ID (project.dataset.table).
+        fields: Field mask for the tables.get partial response.
+        
+    Returns:
+        The table metadata, with only the requested fields populated.
+    """
+    return _get_table(client, table_id, fields)
+
+def _get_table(client: bigquery.Client, table_id: str, fields: str) -> bigquery.Table:
+    """
+    Fetch table metadata, bypassing the metadata cache.
+    
+    Args:
+        client: The BigQuery client to use.
+        table_id: Fully qualified table ID (project.dataset.table).
+        fields: Field mask for the tables.get partial response.
+        
+    Returns:
+        The table metadata, with only the requested fields populated.
+    """
+    # Client.get_table has no field mask option, so call the REST API directly
+    table_ref = bigquery.TableReference.from_string(table_id)
+    resource = client._call_api(
+        DEFAULT_RETRY, method="GET", path=table_ref.path, query_params={"fields": fields}
+    )
+    return bigquery.Table.from_api_repr(resource)
+
+@cached(
+    _dataset_cache,
+    key=lambda client, dataset_id, fields: hashkey(dataset_id, fields),
+    lock=_metadata_lock
+)
+def _cached_get_dataset(client: bigquery.Client, dataset_id: str, fields: str) -> bigquery.Dataset:
+    """
+    Fetch dataset metadata, reusing results fetched within the last five minutes.
+    
+    Args:
+        client: The BigQuery client to use on a cache miss.
+        dataset_id: Fully qualified dataset ID (project.dataset).
+        fields: Field mask for the datasets.get partial response.
+        
+    Returns:
+        The dataset metadata, with only the requested fields populated.
+    """
+    # Client.get_dataset has no field mask option, so call the REST API directly
+    dataset_ref = bigquery.DatasetReference.from_string(dataset_id)
+    resource = client._call_api(
+        DEFAULT_RETRY, method="GET", path=dataset_ref.path, query_params={"fields": fields}
+    )
+    return bigquery.Dataset.from_api_repr(resource)
+
+def _limit_query(query: str, limit: int) -> str:
+    """
+    Add a LIMIT clause to a single SELECT statement that doesn't have one.
+    
+    BigQuery's max_results only caps the client-side iterator; a LIMIT in the
+    SQL stops the server from computing and sending rows that are never shown.
+    
+    Args:
+        query: The SQL query to limit.
+        limit: Maximum number of rows the query should return.
+        
+    Returns:
+        The query with a LIMIT appended, or the original query if it is not a
+        single SELECT or already contains a LIMIT.
+    """
+    try:
+        statements = [
+            statement for statement in sqlparse.parse(query)
+            if statement.token_first(skip_cm=True) is not None
+        ]
+    except SQLParseError:
+        return query
+    if len(statements) != 1 or statements[0].get_type() != "SELECT":
+        return query
+    if LIMIT_RE.search(query):
+        return query
+        
+    # Drop trailing whitespace, comments and the terminating semicolon
+    tokens = list(statements[0].flatten())
+    while tokens and (
+        tokens[-1].is_whitespace
+        or tokens[-1].ttype in sqlparse.tokens.Comment
+        or tokens[-1].match(sqlparse.tokens.Punctuation, ";")
+    ):
+        tokens.pop()
+        
+    # Append rather than wrap in a subquery so an outer ORDER BY is kept
+    statement = "".join(token.value for token in tokens)
+    return f"{statement}\nLIMIT {limit}"
+
+def _ensure_cache_dir() -> None:
+    """Create the cache directory, readable only by the current user."""
+    CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    os.chmod(CACHE_DIR, 0o700)
+
+def _open_private(path: Path, mode: str):
+    """
+    Open a file for writing, creating it readable only by the current user.
+    
+    Args:
+        path: Path of the file.
+        mode: "w" or "wb".
+        
+    Returns:
+        The open file object.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    return os.fdopen(fd, mode)
+
+def _load_page_state() -> Dict[str, str]:
+    """
+    Load the query job and page token saved by the last paged query.
+    
+    Returns:
+        The saved state, or an empty dictionary if there is none.
+    """
+    try:
+        with open(LAST_TOKEN_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_page_state(state: Dict[str, str]) -> None:
+    """
+    Save the query job and next page token so a later run can resume from it.
+    
+    Args:
+        state: The job reference, query and next page token to save.
+    """
+    try:
+        _ensure_cache_dir()
+        with _open_private(LAST_TOKEN_PATH, "w") as f:
+            json.dump(state, f)
+    except OSError as e:
+        print(f"Warning: could not save page token: {e}", file=sys.stderr)
+
+def _load_cached_result(path: Path, ttl: int) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached query result if it was written within the last ttl seconds.
+    
+    Args:
+        path: Path of the cache file.
+        ttl: Maximum age of the cache file, in seconds.
+        
+    Returns:
+        The cached rows, next page token and page state, or None if there is
+        no fresh entry.
+    """
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Truncated or foreign files can fail in many ways; treat any as a miss
+        return None
+
+def _save_cached_result(path: Path, result: Dict[str, Any]) -> None:
+    """
+    Write a query result to the cache and remove entries older than RESULT_CACHE_MAX_AGE.
+    
+    Args:
+        path: Path of the cache file.
+        result: The rows, next page token and page state to cache.
+    """
+    try:
+        _ensure_cache_dir()
+        # Write then rename so concurrent runs never read a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with _open_private(tmp_path, "wb") as f:
+            pickle.dump(result, f)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError) as e:
+        print(f"Warning: could not cache query result: {e}", file=sys.stderr)
+        return
+        
+    # A fixed age rather than this run's TTL, so runs with a shorter
+    # --cache-ttl don't delete entries that other runs still read
+    now = time.time()
+    for cache_file in CACHE_DIR.glob("*.pkl"):
+        try:
+            if now - cache_file.stat().st_mtime > RESULT_CACHE_MAX_AGE:
+                cache_file.unlink()
+        except OSError:
+            pass
+
+def _is_cacheable_query(query: str) -> bool:
+    """
+    Check if a query's results can be reused while its tables are unchanged.
+    
+    Mirrors BigQuery's own cache rules: queries calling non-deterministic
+    functions or reading INFORMATION_SCHEMA views are never cached.
+    
+    Args:
+        query: The SQL query to check.
+        
+    Returns:
+        True if the query's results may be cached, False otherwise.
+    """
+    try:
+        statements = sqlparse.parse(query)
+    except SQLParseError:
+        return False
+    for statement in statements:
+        for token in statement.flatten():
+            if token.ttype in sqlparse.tokens.String or token.ttype in sqlparse.tokens.Comment:
+                continue
+            value = token.value.upper()
+            if value in NONDETERMINISTIC_FUNCTIONS or "INFORMATION_SCHEMA" in value:
+                return False
+    return True
+
+def _parse_option_value(value: Optional[str]) -> str:
+    """
+    Convert an INFORMATION_SCHEMA option value (a quoted string literal) to plain text.
+    
+    Args:
+        value: The raw option_value, e.g. '"Sales transactions"'.
+        
+    Returns:
+        The unquoted string, or an empty string if no value is set.
+    """
+    if not value:
+        return ""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
 
 class BigQueryTool:
     """Tool for interacting with Google BigQuery."""
@@ -55,12 +450,19 @@ class BigQueryTool:
                         from the service account credentials.
         """
         try:
-            self.client = bigquery.Client(project=project_id)
+            self.client = _make_client(project_id)
             if project_id:
                 self.project_id = project_id
             else:
                 self.project_id = self.client.project
                 
+            # Set by run_query when more rows are available after the returned page
+            self.next_page_token = None
+            
+            # Created on first use by _get_bqstorage_client; most commands never need it
+            self._bqstorage_client = None
+            self._bqstorage_available = bigquery_storage is not None
+                
             print(f"Connected to BigQuery project: {self.project_id}", file=sys.stderr)
         except GoogleCloudError as e:
             print(f"Error connecting to BigQuery: {e}")
@@ -74,26 +476,33 @@ class BigQueryTool:
             List of dictionaries containing dataset information.
         """
         try:
-            datasets = list(self.client.list_datasets())
+            datasets = list(self.client.list_datasets(page_size=LIST_PAGE_SIZE))
             
             if not datasets:
                 print(f"No datasets found in project {self.project_id}")
                 return []
                 
-            result = []
-            for dataset_list_item in datasets:
+            def get_description(dataset_list_item) -> str:
                 # Get the full dataset to access description
-                dataset_id = dataset_list_item.dataset_id
-                dataset_ref = self.client.dataset(dataset_id)
                 try:
-                    dataset = self.client.get_dataset(dataset_ref)
-                    description = dataset.description or ""
+                    dataset = _cached_get_dataset(
+                        self.client,
+                        f"{dataset_list_item.project}.{dataset_list_item.dataset_id}",
+                        DATASET_DESCRIPTION_FIELDS
+                    )
+                    return dataset.description or ""
                 except Exception:
                     # If we can't get the full dataset, just use an empty description
-                    description = ""
+                    return ""
+                    
+            # Overlap the per-dataset round-trips
+            with ThreadPoolExecutor(max_workers=MAX_METADATA_WORKERS) as executor:
+                descriptions = list(executor.map(get_description, datasets))
                 
+            result = []
+            for dataset_list_item, description in zip(datasets, descriptions):
                 result.append({
-                    "Dataset ID": dataset_id,
+                    "Dataset ID": dataset_list_item.dataset_id,
                     "Description": description
                 })
                 
@@ -102,19 +511,25 @@ class BigQueryTool:
             print(f"Error listing datasets: {e}")
             sys.exit(1)
             
-    def list_tables(self, dataset_id: str) -> List[Dict[str, str]]:
+    def list_tables(self, dataset_id: str, with_description: bool = False) -> List[Dict[str, str]]:
         """
         List all tables and views in the specified dataset.
         
         Args:
             dataset_id: The ID of the dataset to list tables from.
+            with_description: If True, also fetch each table's description, which
+                              the tables.list response doesn't include.
             
         Returns:
             List of dictionaries containing table information.
         """
+        if with_description:
+            return self._list_tables_with_descriptions(dataset_id)
+            
         try:
+            # tables.list already returns the type, so one paged call is enough
             dataset_ref = self.client.dataset(dataset_id)
-            tables = list(self.client.list_tables(dataset_ref))
+            tables = list(self.client.list_tables(dataset_ref, page_size=LIST_PAGE_SIZE))
             
             if not tables:
                 print(f"No tables found in dataset {dataset_id}")
@@ -122,8 +537,96 @@ class BigQueryTool:
                 
             result = []
             for table in tables:
-                # Get full table to get the description and type
-                full_table = self.client.get_table(table)
+                result.append({
+                    "Table ID": table.table_id,
+                    "Type": "VIEW" if table.table_type == "VIEW" else "TABLE",
+                    "Description": ""
+                })
+                
+            return result
+        except GoogleCloudError as e:
+            print(f"Error listing tables in dataset {dataset_id}: {e}")
+            sys.exit(1)
+            
+    def _list_tables_with_descriptions(self, dataset_id: str) -> List[Dict[str, str]]:
+        """
+        List all tables and views in the specified dataset, including descriptions.
+        
+        Args:
+            dataset_id: The ID of the dataset to list tables from.
+            
+        Returns:
+            List of dictionaries containing table information.
+        """
+        # The IDs are part of the SQL text, so anything else could change the query
+        if not PROJECT_ID_RE.fullmatch(self.project_id or ""):
+            print(f"Invalid project ID: {self.project_id}")
+            sys.exit(1)
+        if not DATASET_ID_RE.fullmatch(dataset_id):
+            print(f"Invalid dataset ID: {dataset_id}")
+            sys.exit(1)
+            
+        query = f"""
+            SELECT t.table_name, t.table_type, o.option_value AS description
+            FROM `{self.project_id}.{dataset_id}`.INFORMATION_SCHEMA.TABLES AS t
+            LEFT JOIN `{self.project_id}.{dataset_id}`.INFORMATION_SCHEMA.TABLE_OPTIONS AS o
+              ON o.table_name = t.table_name AND o.option_name = 'description'
+            ORDER BY t.table_name
+        """
+        try:
+            # A single INFORMATION_SCHEMA query replaces one get_table call per table
+            rows = list(self.client.query(query).result())
+        except Forbidden:
+            # INFORMATION_SCHEMA needs query permissions; fall back to metadata calls
+            return self._list_tables_per_table(dataset_id)
+        except GoogleCloudError as e:
+            print(f"Error listing tables in dataset {dataset_id}: {e}")
+            sys.exit(1)
+            
+        if not rows:
+            print(f"No tables found in dataset {dataset_id}")
+            return []
+            
+        result = []
+        for row in rows:
+            result.append({
+                "Table ID": row.table_name,
+                "Type": "VIEW" if row.table_type == "VIEW" else "TABLE",
+                "Description": _parse_option_value(row.description)
+            })
+            
+        return result
+        
+    def _list_tables_per_table(self, dataset_id: str) -> List[Dict[str, str]]:
+        """
+        List tables by fetching each table's metadata individually.
+        
+        Args:
+            dataset_id: The ID of the dataset to list tables from.
+            
+        Returns:
+            List of dictionaries containing table information.
+        """
+        try:
+            dataset_ref = self.client.dataset(dataset_id)
+            tables = list(self.client.list_tables(dataset_ref, page_size=LIST_PAGE_SIZE))
+            
+            if not tables:
+                print(f"No tables found in dataset {dataset_id}")
+                return []
+                
+            # Get full tables to get the description and type, overlapping the round-trips
+            table_ids = [f"{table.project}.{table.dataset_id}.{table.table_id}" for table in tables]
+            with ThreadPoolExecutor(max_workers=MAX_METADATA_WORKERS) as executor:
+                full_tables = list(executor.map(
+                    lambda table_id: _cached_get_table(
+                        self.client, table_id, TABLE_DESCRIPTION_FIELDS
+                    ),
+                    table_ids
+                ))
+                
+            result = []
+            for table, full_table in zip(tables, full_tables):
                 table_type = "VIEW" if full_table.table_type == "VIEW" else "TABLE"
                 
                 result.append({
@@ -149,8 +652,10 @@ class BigQueryTool:
             List of dictionaries containing column information.
         """
         try:
-            table_ref = self.client.dataset(dataset_id).table(table_id)
-            table = self.client.get_table(table_ref)
+            # One tables.get call; an INFORMATION_SCHEMA query would be a billed job
+            table = _cached_get_table(
+                self.client, f"{self.project_id}.{dataset_id}.{table_id}", TABLE_SCHEMA_FIELDS
+            )
             
             result = []
             for field in table.schema:
@@ -176,81 +681,406 @@ class BigQueryTool:
         Returns:
             True if the query is read-only, False otherwise.
         """
-        for pattern in NON_READONLY_PATTERNS:
-            if pattern.search(query):
-                return False
-        return True
+        # Interned so repeated queries hit the cache with an identity comparison
+        return _is_readonly(sys.intern(query))
             
-    def run_query(self, query: str, dry_run: bool = False) -> Union[List[Dict[str, Any]], str]:
+    def run_query(
+        self,
+        query: str,
+        dry_run: bool = False,
+        page_size: Optional[int] = None,
+        page_token: Optional[str] = None,
+        use_cache: bool = True,
+        cache_ttl: int = RESULT_CACHE_TTL
+    ) -> Union[List[Dict[str, Any]], str]:
         """
-        Run a read-only SQL query and return results (limited to 5 rows).
+        Run a read-only SQL query and return one page of results.
+        
+        Without page_size or page_token, the query is previewed: at most 5 rows
+        are returned and a LIMIT is pushed into the SQL when possible. Otherwise
+        the full result is paged with BigQuery page tokens; after the call,
+        next_page_token holds the token for the following page, if any.
+        
+        Results are cached on disk for cache_ttl seconds. The cache entry is
+        tied to the last-modified time of every table the query reads, so
+        changes to those tables invalidate it.
         
         Args:
             query: The SQL query to run.
             dry_run: If True, validate the query without running it.
+            page_size: Number of rows per page (defaults to 5).
+            page_token: Token from a previous page to continue from.
+            use_cache: If False, always run the query and don't cache the result.
+            cache_ttl: Seconds a cached result stays valid.
             
         Returns:
             List of dictionaries containing query results, or error message.
         """
+        self.next_page_token = None
+        
         # Check if query is read-only
         if not self.is_readonly_query(query):
             return "Error: Only read-only queries are allowed. Data modification operations detected."
             
-        job_config = bigquery.QueryJobConfig(dry_run=dry_run)
+        paged = page_size is not None or page_token is not None
+        if page_size is None:
+            page_size = MAX_RESULT_ROWS
+            
+        if dry_run:
+            job_config = bigquery.QueryJobConfig(dry_run=True)
+        else:
+            if not paged:
+                # A LIMIT would cut off the rows later pages need
+                query = _limit_query(query, MAX_RESULT_ROWS)
+            job_config = bigquery.QueryJobConfig(maximum_bytes_billed=MAX_BYTES_BILLED)
         
         try:
-            # Start the query
-            query_job = self.client.query(query, job_config=job_config)
+            cache_path = None
+            if use_cache and not dry_run:
+                try:
+                    cache_key = self._result_cache_key(query, page_size, page_token)
+                except GoogleCloudError as e:
+                    # e.g. no tables.get on a table behind an authorized view
+                    print(f"Warning: not using the result cache: {e}", file=sys.stderr)
+                    cache_key = None
+                if cache_key is not None:
+                    cache_path = CACHE_DIR / f"{cache_key}.pkl"
+                    cached_result = _load_cached_result(cache_path, cache_ttl)
+                    if cached_result is not None:
+                        print("Using cached query result", file=sys.stderr)
+                        self.next_page_token = cached_result["next_page_token"]
+                        if cached_result.get("page_state"):
+                            # Let a following --page-token resume the original job
+                            _save_page_state(cached_result["page_state"])
+                        return cached_result["rows"]
+                    
+            query_job = None
+            if page_token is not None and not dry_run:
+                # Resume the saved job rather than re-running the query
+                state = _load_page_state()
+                if (state.get("page_token") == page_token
+                        and state.get("project") == self.project_id
+                        and state.get("query") == query):
+                    query_job = self.client.get_job(
+                        state["job_id"], location=state.get("location")
+                    )
+                    
+            if query_job is None:
+                # Start the query
+                query_job = self.client.query(query, job_config=job_config)
             
             if dry_run:
                 # For dry runs, just return the estimated bytes processed
                 bytes_processed = query_job.total_bytes_processed
                 return f"Query validation successful. Estimated bytes processed: {bytes_processed} bytes."
                 
-            # Wait for the query to complete
-            results = query_job.result(max_results=5)
-            
-            # Convert to list of dictionaries
-            result_list = []
-            schema = results.schema
-            field_names = [field.name for field in schema]
-            
-            row_count = 0
-            for row in results:
-                row_dict = {}
-                for i, field_name in enumerate(field_names):
-                    row_dict[field_name] = row[i]
-                result_list.append(row_dict)
-                row_count += 1
-                if row_count >= 5:
-                    break
-                    
+            result_list, self.next_page_token = self._fetch_rows(query_job, page_size, page_token)
+            page_state = None
+            if self.next_page_token is not None:
+                page_state = {
+                    "project": self.project_id,
+                    "job_id": query_job.job_id,
+                    "location": query_job.location,
+                    "query": query,
+                    "page_token": self.next_page_token,
+                }
+                _save_page_state(page_state)
+            if cache_path is not None:
+                _save_cached_result(cache_path, {
+                    "rows": result_list,
+                    "next_page_token": self.next_page_token,
+                    "page_state": page_state,
+                })
             return result_list
         except GoogleCloudError as e:
             return f"Error executing query: {e}"
+            
+    def _result_cache_key(
+        self,
+        query: str,
+        page_size: int,
+        page_token: Optional[str]
+    ) -> Optional[str]:
+        """
+        Build the disk cache key for a page of query results.
+        
+        A dry run (which is free) lists the tables the query reads, and their
+        last-modified times are mixed into the key so the cache misses once any
+        of them changes. Queries whose results can change without that time
+        changing are not cached.
+        
+        Args:
+            query: The SQL query that will be run.
+            page_size: Number of rows per page.
+            page_token: Token of the requested page, or None for the first page.
+            
+        Returns:
+            Hex digest identifying the result, or None if it shouldn't be cached.
+        """
+        if not _is_cacheable_query(query):
+            return None
+            
+        dry_run_job = self.client.query(query, job_config=bigquery.QueryJobConfig(dry_run=True))
+        table_ids = sorted(
+            f"{table.project}.{table.dataset_id}.{table.table_id}"
+            for table in dry_run_job.referenced_tables
+        )
+        if not table_ids:
+            # Nothing to detect changes with
+            return None
+            
+        # Bypass the metadata cache; a stale modified time would serve stale results
+        with ThreadPoolExecutor(max_workers=MAX_METADATA_WORKERS) as executor:
+            tables = list(executor.map(
+                lambda table_id: _get_table(self.client, table_id, TABLE_MODIFIED_FIELDS),
+                table_ids
+            ))
+            
+        parts = [
+            self.project_id,
+            sqlparse.format(query, strip_comments=True).strip(),
+            str(page_size),
+            page_token or "",
+        ]
+        for table_id, table in zip(table_ids, tables):
+            # External data and streamed rows change without updating lastModifiedTime
+            if table.table_type == "EXTERNAL" or table.streaming_buffer is not None:
+                return None
+            modified = table.modified.isoformat() if table.modified else ""
+            parts.append(f"{table_id}@{modified}")
+        return hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+        
+    def _get_bqstorage_client(self) -> "bigquery_storage.BigQueryReadClient":
+        """
+        Get the BigQuery Storage API client, creating it on first use.
+        
+        Returns:
+            The read client, sharing the BigQuery client's credentials.
+        """
+        if self._bqstorage_client is None:
+            self._bqstorage_client = bigquery_storage.BigQueryReadClient(
+                credentials=self.client._credentials
+            )
+        return self._bqstorage_client
+        
+    def _fetch_rows(
+        self,
+        query_job: bigquery.QueryJob,
+        max_rows: int,
+        page_token: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Wait for a query job and download one page of up to max_rows rows.
+        
+        Pages are read from the job's destination table with the REST API.
+        When a first page holds the whole result and is larger than
+        ARROW_ROW_THRESHOLD, it is instead streamed as Arrow record batches
+        through the BigQuery Storage API, if installed and permitted, which
+        avoids per-row JSON decoding.
+        
+        Args:
+            query_job: The running query job.
+            max_rows: Maximum number of rows to return.
+            page_token: Token of the page to read, or None for the first page.
+            
+        Returns:
+            Tuple of the rows as dictionaries and the next page token (None if
+            this is the last page).
+        """
+        # Wait for the query to complete; rows are only fetched when iterated
+        results = query_job.result()
+        
+        if (self._bqstorage_available
+                and page_token is None
+                and max_rows > ARROW_ROW_THRESHOLD
+                and results.total_rows is not None
+                and results.total_rows <= max_rows):
+            # The Storage API has no page tokens, so only use it when nothing is left over
+            try:
+                result_list = []
+                for batch in results.to_arrow_iterable(bqstorage_client=self._get_bqstorage_client()):
+                    result_list.extend(batch.to_pylist())
+                return result_list, None
+            except PermissionDenied:
+                # Needs bigquery.readsessions.create; the REST path below doesn't
+                print("Storage API not permitted, falling back to REST", file=sys.stderr)
+                self._bqstorage_available = False
+            
+        if query_job.destination is None:
+            # Multi-statement scripts have no destination table to page through
+            rows = query_job.result(max_results=max_rows)
+        else:
+            # Page through the destination table so tokens stay valid across runs
+            table = bigquery.Table(query_job.destination, schema=results.schema)
+            rows = self.client.list_rows(
+                table, max_results=max_rows, page_size=max_rows, page_token=page_token
+            )
+        
+        # Convert to list of dictionaries, reading the schema property only once
+        schema = rows.schema
+        result_list = [
+            {field.name: row[i] for i, field in enumerate(schema)}
+            for row in rows
+        ]
+        
+        # The next token is only known once the page has been read
+        next_page_token = rows.next_page_token if query_job.destination is not None else None
+        return result_list, next_page_token
 
-def format_output(data: List[Dict[str, Any]], format_type: str = "table") -> str:
+def _is_plain_text(value: str) -> bool:
     """
-    Format the output data as a table.
+    Check if a cell is text that tabulate would left-align without reformatting.
+    
+    Args:
+        value: The cell value.
+        
+    Returns:
+        True for short, printable ASCII strings that don't parse as numbers.
+    """
+    if len(value) >= PIPE_TABLE_MAX_CELL_WIDTH or not value.isascii() or not value.isprintable():
+        return False
+    try:
+        # tabulate right-aligns numeric strings, including "1,000", "nan" and "inf"
+        float(value.replace(",", ""))
+    except ValueError:
+        return True
+    return False
+
+def _format_pipe_table(data: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Render rows as a pipe table without tabulate, for small simple results.
+    
+    Produces the same output as tabulate(data, headers="keys", tablefmt="pipe")
+    for columns holding only ints or only plain ASCII text (either may contain
+    None). Anything else is left to tabulate.
     
     Args:
         data: List of dictionaries containing the data to format.
-        format_type: Output format (only "table" is currently supported).
         
     Returns:
-        Formatted string representation of the data.
+        The formatted table, or None if the data needs tabulate.
     """
-    if not data:
-        return "No data to display."
+    if len(data) > PIPE_TABLE_MAX_ROWS:
+        return None
+        
+    headers = list(data[0])
+    if not all(isinstance(header, str) and _is_plain_text(header) for header in headers):
+        return None
+    if any(list(row) != headers for row in data):
+        return None
+        
+    columns = []
+    for header in headers:
+        values = [row[header] for row in data]
+        kinds = {type(value) for value in values if value is not None}
+        if kinds == {int}:
+            align_right = True
+            cells = ["" if value is None else str(value) for value in values]
+        elif kinds <= {str}:
+            align_right = False
+            cells = ["" if value is None else value.strip() for value in values]
+            if not all(_is_plain_text(cell) for cell in cells if cell):
+                return None
+        else:
+            return None
+        # tabulate pads headers by two characters before sizing the column
+        width = max([len(header) + 2] + [len(cell) for cell in cells])
+        columns.append((header, cells, align_right, width))
         
+    def format_row(cells: List[str]) -> str:
+        padded = [
+            cell.rjust(width) if align_right else cell.ljust(width)
+            for cell, (_, _, align_right, width) in zip(cells, columns)
+        ]
+        return "| " + " | ".join(padded) + " |"
+        
+    separator = "|" + "|".join(
+        "-" * (width + 1) + ":" if align_right else ":" + "-" * (width + 1)
+        for _, _, align_right, width in columns
+    ) + "|"
+    
+    lines = [format_row(headers), separator]
+    for i in range(len(data)):
+        lines.append(format_row([cells[i] for _, cells, _, _ in columns]))
+    return "\n".join(lines)
+
+def format_output(
+    data: Union[List[Dict[str, Any]], str],
+    format_type: str = "table",
+    file: Optional[TextIO] = None
+) -> str:
+    """
+    Format the output data as a table or CSV.
+    
+    Args:
+        data: List of dictionaries containing the data to format, or a message string.
+        format_type: Output format, "table" or "csv".
+        file: For "csv", a file to write rows to as they are formatted instead
+              of building the whole output as one string.
+        
+    Returns:
+        Formatted string representation of the data (empty if it was written to file).
+    """
     if isinstance(data, str):
         return data
         
+    if not data:
+        return "No data to display."
+        
     if format_type == "table":
+        # Small results of plain text and integers don't need tabulate's type handling
+        table = _format_pipe_table(data)
+        if table is not None:
+            return table
+            
+        # Imported here so error messages don't pay for loading tabulate
+        from tabulate import tabulate
         return tabulate(data, headers="keys", tablefmt="pipe")
+    elif format_type == "csv":
+        output = file if file is not None else io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=list(data[0].keys()), lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(data)
+        return "" if file is not None else output.getvalue()
     else:
         return str(data)
 
+def _positive_int(value: str) -> int:
+    """
+    Parse a command-line value that must be a positive integer.
+    
+    Args:
+        value: The raw argument.
+        
+    Returns:
+        The parsed integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+def _non_negative_int(value: str) -> int:
+    """
+    Parse a command-line value that must be zero or a positive integer.
+    
+    Args:
+        value: The raw argument.
+        
+    Returns:
+        The parsed integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be a non-negative integer: {value!r}")
+    return number
+
 def main():
     """Main entry point for the BigQuery tool."""
     parser = argparse.ArgumentParser(
@@ -273,6 +1103,10 @@ def main():
         "list-tables", help="List all tables in a dataset"
     )
     list_tables_parser.add_argument("dataset_id", help="Dataset ID")
+    list_tables_parser.add_argument(
+        "--with-description", action="store_true",
+        help="Also fetch table descriptions (slower on large datasets)"
+    )
     list_tables_parser.add_argument(
         "--project", help="GCP project ID (uses default from service account if not provided)"
     )
@@ -298,6 +1132,24 @@ def main():
     run_query_parser.add_argument(
         "--dry-run", action="store_true", help="Validate the query without executing it"
     )
+    run_query_parser.add_argument(
+        "--page-size", type=_positive_int,
+        help=f"Rows per page; pages through the full result instead of previewing it (default: {MAX_RESULT_ROWS})"
+    )
+    run_query_parser.add_argument(
+        "--page-token", help="Page token printed by a previous run, to fetch the next page"
+    )
+    run_query_parser.add_argument(
+        "--format", choices=["table", "csv"], default="table",
+        help="Output format; csv suits saving results to a file or passing them to other tools"
+    )
+    run_query_parser.add_argument(
+        "--no-cache", action="store_true", help="Always run the query instead of using a cached result"
+    )
+    run_query_parser.add_argument(
+        "--cache-ttl", type=_non_negative_int, default=RESULT_CACHE_TTL,
+        help=f"Seconds a cached result stays valid (default: {RESULT_CACHE_TTL})"
+    )
     
     args = parser.parse_args()
     
@@ -307,10 +1159,10 @@ def main():
         
     # Check if GOOGLE_APPLICATION_CREDENTIALS is set
     if "GOOGLE_APPLICATION_CREDENTIALS" not in os.environ:
-        print("Warning: GOOGLE_APPLICATION_CREDENTIALS environment variable is not set.")
-        print("Set it in your .env file to the path of your service account key file:")
-        print("GOOGLE_APPLICATION_CREDENTIALS=/path/to/your-key-file.json")
-        print("Continuing with default authentication...")
+        print("Warning: GOOGLE_APPLICATION_CREDENTIALS environment variable is not set.", file=sys.stderr)
+        print("Set it in your .env file to the path of your service account key file:", file=sys.stderr)
+        print("GOOGLE_APPLICATION_CREDENTIALS=/path/to/your-key-file.json", file=sys.stderr)
+        print("Continuing with default authentication...", file=sys.stderr)
     else:
         print(f"Using service account key: {os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')}", file=sys.stderr)
         
@@ -322,14 +1174,27 @@ def main():
         result = bq.list_datasets()
         print(format_output(result))
     elif args.command == "list-tables":
-        result = bq.list_tables(args.dataset_id)
+        result = bq.list_tables(args.dataset_id, args.with_description)
         print(format_output(result))
     elif args.command == "get-schema":
         result = bq.get_schema(args.dataset_id, args.table_id)
         print(format_output(result))
     elif args.command == "run-query":
-        result = bq.run_query(args.query, args.dry_run)
-        print(format_output(result))
+        result = bq.run_query(
+            args.query, args.dry_run, args.page_size, args.page_token,
+            use_cache=not args.no_cache, cache_ttl=args.cache_ttl
+        )
+        if args.format == "csv":
+            if isinstance(result, str) or not result:
+                # Errors, dry-run summaries and "no data" aren't rows; keep them out of the CSV
+                print(format_output(result), file=sys.stderr)
+            else:
+                # The rows are already in memory; this only avoids a second copy as one CSV string
+                format_output(result, "csv", file=sys.stdout)
+        else:
+            print(format_output(result))
+        if bq.next_page_token is not None:
+            print(f"Next page token: {bq.next_page_token}", file=sys.stderr)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file